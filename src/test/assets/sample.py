@@ -3,6 +3,7 @@ Sample Python file to demonstrate Doc Translate extension
 This module contains various comment styles that will be translated
 """
 
+import time
 from typing import Optional, List, Dict
 from datetime import datetime
 
@@ -13,6 +14,9 @@ class User:
     Contains basic user information
     """
 
+    # Fixed attribute layout avoids a per-instance __dict__
+    __slots__ = ('id', 'name', 'name_cf', 'email', 'created_at')
+
     def __init__(self, user_id: int, name: str, email: str):
         """
         Initialize a new User instance
@@ -24,6 +28,7 @@ class User:
         """
         self.id = user_id
         self.name = name
+        self.name_cf = name.casefold()  # Casefolded for case-insensitive search
         self.email = email
         self.created_at = datetime.now()  # Timestamp when user was created
 
@@ -51,13 +56,30 @@ class UserManager:
         Returns:
             True if the user was added successfully, False otherwise
         """
-        # Check if user already exists
-        if user.id in self.users:
-            return False  # User already exists
+        # Insert only if the ID is free; an existing user is left untouched
+        count = len(self.users)
+        self.users.setdefault(user.id, user)
+        return len(self.users) > count  # Grew only if the user was new
+
+    def add_users(self, users: List[User]) -> int:
+        """
+        Adds multiple users to the system in one batch
+        Users whose ID already exists are skipped
         
-        # Add user to the dictionary
-        self.users[user.id] = user
-        return True
+        Args:
+            users: The User objects to add
+            
+        Returns:
+            The number of users that were added
+        """
+        # Keep the first occurrence of each new ID
+        new_users: Dict[int, User] = {}
+        for user in users:
+            if user.id not in self.users and user.id not in new_users:
+                new_users[user.id] = user
+        
+        self.users.update(new_users)
+        return len(new_users)
 
     def get_user(self, user_id: int) -> Optional[User]:
         """
@@ -96,6 +118,7 @@ class UserManager:
         """
         if name is not None:
             user.name = name
+            user.name_cf = name.casefold()
         if email is not None:
             user.email = email
         
@@ -140,13 +163,13 @@ class UserManager:
         Returns:
             A list of matching User objects
         """
-        normalized_query = query.lower()
+        normalized_query = query.casefold()
         results = []
         
         # Iterate through all users
         for user in self.users.values():
             # Check if the name contains the query
-            if normalized_query in user.name.lower():
+            if normalized_query in user.name_cf:
                 results.append(user)
         
         return results
@@ -175,7 +198,7 @@ def generate_user_id() -> int:
         A unique numeric ID
     """
     # Use timestamp as ID
-    return int(datetime.now().timestamp() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 # Example usage